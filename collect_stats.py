@@ -3,22 +3,29 @@
 
 import argparse
 import csv
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 from leetcode_client import LeetCodeClient
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent
+TAIL_WINDOW_BYTES = 4096
 
 
 def load_config(config_path: Path) -> dict:
     try:
         with config_path.open() as config_file:
-            return yaml.safe_load(config_file) or {}
+            return yaml.load(config_file, Loader=YamlLoader) or {}
     except (OSError, yaml.YAMLError) as exc:
         print(f"Unable to load {config_path}: {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
@@ -28,14 +35,32 @@ def read_last_total(output_path: Path) -> int | None:
     if not output_path.exists():
         return None
 
-    last_total = None
-    with output_path.open(newline="") as source:
-        for row in csv.DictReader(source):
-            try:
-                last_total = int(row["total_submissions"])
-            except (KeyError, TypeError, ValueError):
-                continue
-    return last_total
+    # Only the newest sample matters, so scan backwards from the end of the
+    # file in growing windows instead of parsing the whole history.
+    with output_path.open("rb") as source:
+        header = next(csv.reader([source.readline().decode()]), [])
+        if "total_submissions" not in header:
+            return None
+        total_index = header.index("total_submissions")
+        data_start = source.tell()
+        end = source.seek(0, os.SEEK_END)
+
+        window = TAIL_WINDOW_BYTES
+        while True:
+            offset = max(data_start, end - window)
+            source.seek(offset)
+            lines = source.read(end - offset).splitlines()
+            if offset > data_start:
+                # The first line may start mid-row.
+                lines = lines[1:]
+            for line in reversed(lines):
+                try:
+                    return int(next(csv.reader([line.decode()]))[total_index])
+                except (IndexError, StopIteration, ValueError):
+                    continue
+            if offset == data_start:
+                return None
+            window *= 2
 
 
 def collect(config: dict, verbose: bool = False) -> dict:
@@ -65,12 +90,12 @@ def collect(config: dict, verbose: bool = False) -> dict:
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "total_submissions": total_submissions,
     }
-    file_exists = output_path.exists()
+    # Both fields are plain ISO-8601/integer values, so the row is written
+    # directly in the csv module's default dialect (comma, CRLF).
     with output_path.open("a", newline="") as output:
-        writer = csv.DictWriter(output, fieldnames=row.keys())
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+        if output.tell() == 0:
+            output.write(",".join(row) + "\r\n")
+        output.write(f"{row['timestamp']},{row['total_submissions']}\r\n")
 
     if verbose:
         print(f"Two Sum total submissions: {total_submissions:,}")
@@ -10,16 +10,25 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
 from jinja2 import Environment, FileSystemLoader
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(PROJECT_ROOT / "templates")),
+    auto_reload=False,
+)
 
 
 def load_config(config_path: Path) -> dict:
     try:
         with config_path.open() as config_file:
-            return yaml.safe_load(config_file) or {}
+            return yaml.load(config_file, Loader=YamlLoader) or {}
     except (OSError, yaml.YAMLError) as exc:
         print(f"Unable to load {config_path}: {exc}", file=sys.stderr)
         raise SystemExit(1) from exc
@@ -31,11 +40,20 @@ def parse_csv(file_path: Path, history_days: int) -> list[dict]:
 
     parsed_rows = []
     try:
-        with file_path.open() as source:
-            for row in csv.DictReader(source):
-                timestamp = row.get("timestamp")
-                total = row.get("total_submissions")
-                if not timestamp or total is None:
+        with file_path.open(newline="") as source:
+            reader = csv.reader(source)
+            header = next(reader, [])
+            if "timestamp" not in header or "total_submissions" not in header:
+                return []
+            timestamp_index = header.index("timestamp")
+            total_index = header.index("total_submissions")
+            min_length = max(timestamp_index, total_index) + 1
+            for row in reader:
+                if len(row) < min_length:
+                    continue
+                timestamp = row[timestamp_index]
+                total = row[total_index]
+                if not timestamp:
                     continue
                 try:
                     parsed_rows.append(
@@ -69,8 +87,7 @@ def generate_html(config: dict, output_path: Path) -> None:
     if not data_path.is_absolute():
         data_path = PROJECT_ROOT / data_path
 
-    env = Environment(loader=FileSystemLoader(str(PROJECT_ROOT / "templates")))
-    template = env.get_template("template.html")
+    template = TEMPLATE_ENV.get_template("template.html")
     html = template.render(
         DATA_JSON=json.dumps(
             parse_csv(data_path, history_days), separators=(",", ":")
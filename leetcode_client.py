@@ -1,52 +1,59 @@
 #!/usr/bin/env python3
 """Minimal LeetCode GraphQL client used by the collector."""
 
+import json
 import sys
 import time
 
 import requests
 
 
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "Content-Type": "application/json",
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36",
+    }
+)
+
+
 class LeetCodeClient:
     """Fetch the cumulative submission count for a LeetCode problem."""
 
     GRAPHQL_URL = "https://leetcode.com/graphql"
+    STATS_QUERY = (
+        "query questionTitle($titleSlug: String!) "
+        "{ question(titleSlug: $titleSlug) { stats } }"
+    )
+    MAX_RETRY_AFTER = 60
+
+    @classmethod
+    def _retry_delay(cls, exc: Exception, attempt: int) -> float:
+        """Honor a numeric Retry-After header, otherwise back off exponentially."""
+        response = getattr(exc, "response", None)
+        retry_after = ""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(int(retry_after), cls.MAX_RETRY_AFTER)
+        return 2 ** (attempt - 1)
 
     @classmethod
     def get_total_submissions(cls, title_slug: str, max_attempts: int = 3) -> int | None:
-        query = """
-        query questionTitle($titleSlug: String!) {
-          question(titleSlug: $titleSlug) {
-            stats
-          }
-        }
-        """
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36",
-        }
-        payload = {"query": query, "variables": {"titleSlug": title_slug}}
+        payload = {"query": cls.STATS_QUERY, "variables": {"titleSlug": title_slug}}
 
         for attempt in range(1, max_attempts + 1):
             try:
-                response = requests.post(
-                    cls.GRAPHQL_URL,
-                    json=payload,
-                    headers=headers,
-                    timeout=10,
-                )
+                response = _SESSION.post(cls.GRAPHQL_URL, json=payload, timeout=10)
                 response.raise_for_status()
 
                 response_data = response.json()
-                question = response_data.get("data", {}).get("question")
+                question = (response_data.get("data") or {}).get("question")
                 if not question or not question.get("stats"):
                     raise ValueError("response did not contain question statistics")
 
-                stats = question["stats"]
-                import json
-
-                return int(json.loads(stats)["totalSubmissionRaw"])
+                return int(json.loads(question["stats"])["totalSubmissionRaw"])
             except (requests.RequestException, ValueError, KeyError, TypeError) as exc:
                 if attempt == max_attempts:
                     print(
@@ -54,6 +61,6 @@ class LeetCodeClient:
                         file=sys.stderr,
                     )
                     return None
-                time.sleep(2 ** (attempt - 1))
+                time.sleep(cls._retry_delay(exc, attempt))
 
         return None